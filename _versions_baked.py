@@ -0,0 +1,433 @@
+# This file is generated by tools/bake_versions.py from citrix-netscaler-versions.csv, do not edit it by hand.
+#
+# Original Citrix NetScaler version CSV file:
+#  - https://gist.github.com/fox-srt/c7eb3cbc6b4bf9bb5a874fa208277e86
+
+from types import MappingProxyType
+
+vhash_to_version = MappingProxyType(
+    {
+        "26df0e65fba681faaeb333058a8b28bf": "12.1-50.28",
+        "d3b5c691a4cfcc6769da8dc4e40f511d": "12.1-50.31",
+        "1ffe249eccc42133689c145dc37d6372": "",
+        "995a76005c128f4e89474af12ac0de66": "12.1-51.16",
+        "d2bd166fed66cdf035a0778a09fd688c": "12.1-51.19",
+        "489cadbd8055b1198c9c7fa9d34921b9": "",
+        "86b4b2567b05dff896aae46d6e0765bc": "13.0-36.27",
+        "73217f4753a74300c0a2ad762c6f1e65": "",
+        "dc8897f429a694d44934954b47118908": "",
+        "43a8abf580ea09a5fa8aa1bd579280b9": "13.0-41.20",
+        "0705e646dc7f84d77e8e48561253be12": "",
+        "09a78a600b4fc5b9f581347604f70c0e": "",
+        "7116ed70ec000da9267a019728ed951e": "13.0-41.28",
+        "8c62b39f7068ea2f3d3f7d40860c0cd4": "12.1-55.13",
+        "fedb4ba86b5edcbc86081f2893dc9fdf": "13.0-47.22",
+        "02d30141fd053d5c3448bf04fbedb8d6": "12.1-55.18",
+        "fd96bc8977256003de05ed84270b90bb": "13.0-47.24",
+        "f787f9a8c05a502cd33f363e1e9934aa": "12.1-55.24",
+        "b5fae8db23061679923e4b2a9b6c7a82": "",
+        "e79f3bbf822c1fede6b5a1a4b6035a41": "13.0-52.24",
+        "f2db014a3eb9790a19dfd71331e7f5d0": "12.1-56.22",
+        "fdf2235967556bad892fbf29ca69eefd": "13.0-58.30",
+        "4ecb5abf6e4b1655c07386a2c958597c": "12.1-57.18",
+        "dcb06155d51a0234e9d127658ef9f21f": "13.0-58.32",
+        "12c4901ecc3677aad06f678be49cb837": "13.0-61.48",
+        "a1494e2e09cb96e424c6c66512224941": "",
+        "b1b38debf0e55c285c72465da3715034": "12.1-58.15",
+        "06fbfcf525e47b5538f856965154e28c": "13.0-64.35",
+        "7a0c8874e93395c5e4f1ef3e5e600a25": "12.1-59.16",
+        "a8e0eb4a1b3e157e0d3a5e57dc46fd35": "13.0-67.39",
+        "0aef7f8e9ea2b528aa2073f2875a28b8": "12.1-55.190",
+        "f1eb8548a4f1d4e565248d4db456fffe": "",
+        "e2444db11d0fa5ed738aa568c2630704": "13.0-67.43",
+        "62eba0931b126b1558fea39fb466e588": "",
+        "9b545e2e4d153348bce08e3923cdfdc1": "13.0-71.40",
+        "25ad60e92a33cbb5dbd7cd8c8380360d": "13.0-71.44",
+        "0b516b768edfa45775c4be130c4b96b5": "12.1-60.19",
+        "b3deb35b8a990a71acca052fd1e6e6e1": "12.1-55.210",
+        "f0cc58ce7ec931656d9fcbfe50d37c4b": "",
+        "83e486e7ee7eb07ab88328a51466ac28": "12.1-61.18",
+        "454d4ccdefa1d802a3f0ca474a2edd73": "13.0-76.29",
+        "08ff522057b9422863dbabb104c7cf4b": "12.1-61.19",
+        "648767678188e1567b7d15eee5714220": "13.0-76.31",
+        "ce5da251414abbb1b6aed6d6141ed205": "12.1-61.19",
+        "5e55889d93ff0f13c39bbebb4929a68e": "13.0-79.64",
+        "35389d54edd8a7ef46dadbd00c1bc5ac": "12.1-62.21",
+        "9f4514cd7d7559fa1fb28960b9a4c22d": "",
+        "8e4425455b9da15bdcd9d574af653244": "12.1-62.23",
+        "73952bdeead9629442cd391d64c74d93": "13.0-82.41",
+        "25169dea48ef0f939d834468f3c626d2": "13.0-82.42",
+        "efb9d8994f9656e476e80f9b278c5dae": "12.1-62.25",
+        "affa5cd9f00480f144eda6334e03ec27": "",
+        "e1ebdcea7585d24e9f380a1c52a77f5d": "12.1-62.27",
+        "eb3f8a7e3fd3f44b70c121101618b80d": "13.0-82.45",
+        "98a21b87cc25d486eb4189ab52cbc870": "13.1-4.43",
+        "c9e95a96410b8f8d4bde6fa31278900f": "13.0-83.27",
+        "435b27d8f59f4b64a6beccb39ce06237": "",
+        "f3d4041188d723fec4547b1942ffea93": "12.1-63.22",
+        "158c7182df4973f1f5346e21e9d97a01": "13.1-4.44",
+        "a66c02f4d04a1bd32bfdcc1655c73466": "13.0-83.29",
+        "5cd6bd7d0aec5dd13a1afb603111733a": "12.1-63.23",
+        "645bded68068748e3314ad3e3ec8eb8f": "13.1-9.60",
+        "5112d5394de0cb5f6d474e032a708907": "13.1-12.50",
+        "3a316d2de5362e9f76280b3157f48d08": "13.0-84.10",
+        "ee44bd3bc047aead57bc000097e3d8aa": "12.1-63.24",
+        "13693866faf642734f0498eb45f73672": "",
+        "2b46554c087d2d5516559e9b8bc1875d": "13.0-84.11",
+        "cf9d354b261231f6c6121058ba143af7": "13.1-12.51",
+        "c6bcd2f119d83d1de762c8c09b482546": "12.1-64.16",
+        "b3fb0319d5d2dad8c977b9986cc26bd8": "12.1-55.265",
+        "0f3a063431972186f453e07954f34eb8": "13.1-17.42",
+        "7364f85dc30b3d570015e04f90605854": "",
+        "e42d7b3cf4a6938aecebdae491ba140c": "13.0-85.15",
+        "310ffb5a44db3a14ed623394a4049ff9": "",
+        "2edf0f445b69b2e322e80dbc3f6f711c": "12.1-55.276",
+        "b4ac9c8852a04234f38d73d1d8238d37": "13.1-21.50",
+        "9f73637db0e0f987bf7825486bfb5efe": "12.1-55.278",
+        "c212a67672ef2da5a74ecd4e18c25835": "12.1-64.17",
+        "fbdc5fbaed59f858aad0a870ac4a779c": "12.1-65.15",
+        "1884e7877a13a991b6d3fac01efbaf79": "13.0-85.19",
+        "853edb55246c138c530839e638089036": "13.1-24.38",
+        "7a45138b938a54ab056e0c35cf0ae56c": "13.0-86.17",
+        "4434db1ec24dd90750ea176f8eab213c": "12.1-65.17",
+        "469591a5ef8c69899320a319d5259922": "12.1-55.282",
+        "adc1f7c850ca3016b21776467691a767": "13.1-27.59",
+        "1f63988aa4d3f6d835704be50c56788a": "13.0-87.9",
+        "57d9f58db7576d6a194d7dd10888e354": "13.1-30.52",
+        "7afe87a42140b566a2115d1e232fdc07": "13.1-33.47",
+        "c1b64cea1b80e973580a73b787828daf": "12.1-65.21",
+        "4d817946cef53571bc303373fd6b406b": "12.1-55.289",
+        "aff0ad8c8a961d7b838109a7ee532bcb": "13.1-33.49",
+        "37c10ac513599cf39997d52168432c0e": "13.0-88.12",
+        "27292ddd74e24a311e4269de9ecaa6e7": "13.0-88.13",
+        "5e939302a9d7db7e35e63a39af1c7bec": "13.1-33.51",
+        "6e7b2de88609868eeda0b1baf1d34a7e": "13.0-88.14",
+        "56672635f81a1ce1f34f828fef41d2fa": "13.1-33.52",
+        "8ecc8331379bc60f49712c9b25f276ea": "",
+        "86c7421a034063574799dcd841ee88f0": "",
+        "9bf6d5d3131495969deba0f850447947": "13.1-33.54",
+        "3bd7940b6425d9d4dba7e8b656d4ba65": "13.0-88.16",
+        "0d656200c32bb47c300b81e599260c42": "13.1-37.38",
+        "953fae977d4baedf39e83c9d1e134ef1": "12.1-55.291",
+        "f063b04477adc652c6dd502ac0c39a75": "12.1-65.25",
+        "14c6a775edda324764a940cfd3da48cb": "13.0-89.7",
+        "c2b8537eb733844f1e0cc4f63210d016": "13.0-90.7",
+        "b4c220db03ea18bc2eebb40e9ad3f4f8": "13.1-42.47",
+        "0b2a3cb74b5c6adbe28827e8b76a9f64": "12.1-55.296",
+        "6925fba74320b9bfb960299f7c3e7cce": "13.1-45.61",
+        "cdb72bd7677da8af9942897256782c9b": "13.1-37.150",
+        "281b46a105662de06fb259293aa79f2a": "13.0-90.11",
+        "1487b55f253ea54b1d3603cc1212f164": "13.1-45.62",
+        "a6a783263968040a97e44d7cac55eda6": "12.1-65.35",
+        "d72c9f2af7ccded704862da7486cfef2": "13.1-45.63",
+        "14195083e08df261613408eb5cf3b212": "13.1-45.64",
+        "4d63b52cc99fe712f9be5e4795c854e9": "13.0-90.12",
+        "e72b4f05a103118667208783b57eee3b": "",
+        "46d83b1a2981c1cfefe8d3063adf78f4": "13.1-37.159",
+        "28e592a607e8919cc6ca7dec63590e04": "12.1-55.297",
+        "155a75fb7efac3347e7362fd23083aa5": "12.1-55.300",
+        "f6beac6ccd073f5f7c1a64c4c7e24c7e": "12.1-55.302",
+        "fe1071e2b14a5b5016d3eb57ddcfc86d": "12.1-55.304",
+    }
+)
+
+vstamp_to_version = MappingProxyType(
+    {
+        1535167752: "12.1-49.23",
+        1539712460: "12.1-49.37",
+        1543395386: "12.1-50.28",
+        1547833294: "12.1-50.31",
+        1550038312: "",
+        1551259802: "12.1-51.16",
+        1553553428: "12.1-51.19",
+        1555671862: "",
+        1557769307: "13.0-36.27",
+        1559549823: "",
+        1563208967: "",
+        1568102085: "13.0-41.20",
+        1568672574: "",
+        1570444648: "",
+        1570800276: "13.0-41.28",
+        1572931127: "12.1-55.13",
+        1574967982: "13.0-47.22",
+        1579524387: "12.1-55.18",
+        1579525745: "13.0-47.24",
+        1582900076: "12.1-55.24",
+        1584553276: "",
+        1584639643: "13.0-52.24",
+        1585473032: "12.1-56.22",
+        1590994121: "13.0-58.30",
+        1591729615: "12.1-57.18",
+        1593707893: "13.0-58.32",
+        1595447367: "13.0-61.48",
+        1597416844: "",
+        1598960821: "12.1-58.15",
+        1598976896: "13.0-64.35",
+        1600737705: "12.1-59.16",
+        1602086829: "13.0-67.39",
+        1602147782: "12.1-55.190",
+        1604484881: "",
+        1605272190: "13.0-67.43",
+        1606051758: "",
+        1606972406: "13.0-71.40",
+        1609009448: "13.0-71.44",
+        1609011565: "12.1-60.19",
+        1609729665: "12.1-55.210",
+        1609926222: "",
+        1612272966: "12.1-61.18",
+        1613673469: "13.0-76.29",
+        1615224221: "12.1-61.19",
+        1615281639: "13.0-76.31",
+        1615477570: "12.1-61.19",
+        1617632002: "13.0-79.64",
+        1620657482: "12.1-62.21",
+        1620819371: "",
+        1621266971: "12.1-62.23",
+        1622469918: "13.0-82.41",
+        1623352880: "13.0-82.42",
+        1623368345: "12.1-62.25",
+        1625590978: "",
+        1625622338: "12.1-62.27",
+        1626453956: "13.0-82.45",
+        1631259090: "13.1-4.43",
+        1632751280: "13.0-83.27",
+        1634039626: "",
+        1634113449: "12.1-63.22",
+        1636641773: "13.1-4.44",
+        1636650155: "13.0-83.29",
+        1636661207: "12.1-63.23",
+        1637163803: "13.1-9.60",
+        1639153035: "13.1-12.50",
+        1639162109: "13.0-84.10",
+        1640166898: "12.1-63.24",
+        1640170652: "",
+        1640186329: "13.0-84.11",
+        1640248123: "13.1-12.51",
+        1642646201: "12.1-64.16",
+        1643350935: "12.1-55.265",
+        1645447769: "13.1-17.42",
+        1645599730: "",
+        1646925462: "13.0-85.15",
+        1648842091: "",
+        1648963108: "12.1-55.276",
+        1649311904: "13.1-21.50",
+        1650526474: "12.1-55.278",
+        1650537528: "12.1-64.17",
+        1650655111: "12.1-65.15",
+        1652947813: "13.0-85.19",
+        1653569469: "13.1-24.38",
+        1655226228: "13.0-86.17",
+        1656510368: "12.1-65.17",
+        1657097682: "12.1-55.282",
+        1657104103: "13.1-27.59",
+        1659116392: "13.0-87.9",
+        1661353021: "13.1-30.52",
+        1663959215: "13.1-33.47",
+        1664899863: "12.1-65.21",
+        1665559544: "12.1-55.289",
+        1665594088: "13.1-33.49",
+        1665767445: "13.0-88.12",
+        1667231699: "13.0-88.13",
+        1667233903: "13.1-33.51",
+        1667452925: "13.0-88.14",
+        1667453909: "13.1-33.52",
+        1668140181: "",
+        1668146431: "",
+        1668678940: "13.1-33.54",
+        1668681438: "13.0-88.16",
+        1669203751: "13.1-37.38",
+        1669636505: "12.1-55.291",
+        1669808545: "12.1-65.25",
+        1671033279: "13.0-89.7",
+        1674582275: "13.0-90.7",
+        1677072689: "13.1-42.47",
+        1680677853: "12.1-55.296",
+        1681286714: "13.1-45.61",
+        1681754964: "13.1-37.150",
+        1681918478: "13.0-90.11",
+        1682509375: "13.1-45.62",
+        1682714340: "12.1-65.35",
+        1682844871: "13.1-45.63",
+        1683866996: "13.0-91.12",
+        1683876838: "13.1-45.64",
+        1684146224: "13.0-90.12",
+        1685777750: "13.1-48.47",
+        1688743976: "13.0-91.13",
+        1688746510: "",
+        1688746627: "13.1-37.159",
+        1688747367: "12.1-55.297",
+        1689014191: "13.1-49.13",
+        1690503901: "14.1-4.42",
+        1693379034: "13.0-92.18",
+        1694760036: "14.1-8.50",
+        1695273924: "13.0-92.19",
+        1695277021: "13.1-49.15",
+        1695316368: "12.1-55.300",
+        1695817672: "13.1-37.164",
+        1697614024: "13.1-50.23",
+        1700677179: "14.1-12.30",
+        1702062640: "13.1-51.14",
+        1702548756: "13.0-92.21",
+        1702625218: "13.1-51.15",
+        1702631914: "14.1-12.35",
+        1702886392: "12.1-55.302",
+        1704428153: "13.1-37.176",
+        1707370491: "14.1-17.38",
+        1709227868: "13.1-52.19",
+        1713474810: "14.1-21.57",
+        1714542524: "12.1-55.304",
+        1715618728: "13.1-53.17",
+        1715691351: "13.1-37.183",
+        1717831730: "14.1-25.53",
+    }
+)
+
+# All rdx_en timestamps in ascending order
+stamps = (
+    1535167752,
+    1539712460,
+    1543395386,
+    1547833294,
+    1550038312,
+    1551259802,
+    1553553428,
+    1555671862,
+    1557769307,
+    1559549823,
+    1563208967,
+    1568102085,
+    1568672574,
+    1570444648,
+    1570800276,
+    1572931127,
+    1574967982,
+    1579524387,
+    1579525745,
+    1582900076,
+    1584553276,
+    1584639643,
+    1585473032,
+    1590994121,
+    1591729615,
+    1593707893,
+    1595447367,
+    1597416844,
+    1598960821,
+    1598976896,
+    1600737705,
+    1602086829,
+    1602147782,
+    1604484881,
+    1605272190,
+    1606051758,
+    1606972406,
+    1609009448,
+    1609011565,
+    1609729665,
+    1609926222,
+    1612272966,
+    1613673469,
+    1615224221,
+    1615281639,
+    1615477570,
+    1617632002,
+    1620657482,
+    1620819371,
+    1621266971,
+    1622469918,
+    1623352880,
+    1623368345,
+    1625590978,
+    1625622338,
+    1626453956,
+    1631259090,
+    1632751280,
+    1634039626,
+    1634113449,
+    1636641773,
+    1636650155,
+    1636661207,
+    1637163803,
+    1639153035,
+    1639162109,
+    1640166898,
+    1640170652,
+    1640186329,
+    1640248123,
+    1642646201,
+    1643350935,
+    1645447769,
+    1645599730,
+    1646925462,
+    1648842091,
+    1648963108,
+    1649311904,
+    1650526474,
+    1650537528,
+    1650655111,
+    1652947813,
+    1653569469,
+    1655226228,
+    1656510368,
+    1657097682,
+    1657104103,
+    1659116392,
+    1661353021,
+    1663959215,
+    1664899863,
+    1665559544,
+    1665594088,
+    1665767445,
+    1667231699,
+    1667233903,
+    1667452925,
+    1667453909,
+    1668140181,
+    1668146431,
+    1668678940,
+    1668681438,
+    1669203751,
+    1669636505,
+    1669808545,
+    1671033279,
+    1674582275,
+    1677072689,
+    1680677853,
+    1681286714,
+    1681754964,
+    1681918478,
+    1682509375,
+    1682714340,
+    1682844871,
+    1683866996,
+    1683876838,
+    1684146224,
+    1685777750,
+    1688743976,
+    1688746510,
+    1688746627,
+    1688747367,
+    1689014191,
+    1690503901,
+    1693379034,
+    1694760036,
+    1695273924,
+    1695277021,
+    1695316368,
+    1695817672,
+    1697614024,
+    1700677179,
+    1702062640,
+    1702548756,
+    1702625218,
+    1702631914,
+    1702886392,
+    1704428153,
+    1707370491,
+    1709227868,
+    1713474810,
+    1714542524,
+    1715618728,
+    1715691351,
+    1717831730,
+)
@@ -8,7 +8,10 @@
 #
 import argparse
 import re
-from typing import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from stat import S_ISREG
+from typing import Iterator, Optional
 
 try:
     from tabulate import tabulate
@@ -17,15 +20,37 @@ except ImportError:
 
 try:
     from dissect.target import Target
+    from dissect.target.exceptions import FilesystemError
     from dissect.target.tools.info import print_target_info
     from dissect.util.ts import from_unix
     from flow.record import RecordDescriptor
 except ImportError:
     raise ImportError("dissect missing, please use `pip install dissect`")
 
+# Optional, speeds up matching of suspicious PHP code
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 EXPECTED_PHP_FILE_PERMISSION = 0o444
 
-SUSPICIOUS_PHP_CONTENTS = {"eval($_", "base64_decode(", "http_status_code(", "http_status_code(", "array_filter("}
+SUSPICIOUS_PHP_CONTENTS = ("eval($_", "base64_decode(", "http_status_code(", "array_filter(")
+
+# One named group per pattern, so a match can be mapped back to its entry in SUSPICIOUS_PHP_CONTENTS
+SUSPICIOUS_PHP_RE = re.compile(
+    b"|".join(b"(?P<p%d>%s)" % (idx, re.escape(evil.encode())) for idx, evil in enumerate(SUSPICIOUS_PHP_CONTENTS)),
+    re.IGNORECASE,
+)
+
+SUSPICIOUS_PHP_DB = None
+if hyperscan is not None:
+    SUSPICIOUS_PHP_DB = hyperscan.Database()
+    SUSPICIOUS_PHP_DB.compile(
+        expressions=[re.escape(evil.encode()) for evil in SUSPICIOUS_PHP_CONTENTS],
+        ids=list(range(len(SUSPICIOUS_PHP_CONTENTS))),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(SUSPICIOUS_PHP_CONTENTS),
+    )
 
 MAXIMUM_BYTE_SIZE_PHP_TO_CHECK_CONTENTS = 2048
 
@@ -41,58 +66,65 @@ WEBSHELL_PATHS = [
 
 TIMESTOMP_DIRS = WEBSHELL_PATHS + ["/var/tmp"]
 
-KNOWN_SUID_BINARIES = [
-    "/netscaler/ping",
-    "/netscaler/ping6",
-    "/netscaler/traceroute",
-    "/netscaler/traceroute6",
-    "/sbin/mksnap_ffs",
-    "/sbin/shutdown",
-    "/sbin/poweroff",
-    "/usr/bin/crontab",
-    "/usr/bin/lock",
-    "/usr/bin/login",
-    "/usr/bin/passwd",
-    "/usr/bin/yppasswd",
-    "/usr/bin/su",
-    "/usr/libexec/ssh-keysign",
-    "/bin/umount",
-    "/bin/ping",
-    "/bin/mount",
-    "/bin/su",
-    "/bin/ping6",
-    "/lib64/dbus-1/dbus-daemon-launch-helper",
-    "/usr/bin/atq",
-    "/usr/bin/at",
-    "/usr/bin/sudo",
-    "/usr/bin/newgrp",
-    "/usr/bin/chsh",
-    "/usr/bin/sg",
-    "/usr/bin/gpasswd",
-    "/usr/bin/chfn",
-    "/usr/bin/sudoedit",
-    "/usr/bin/staprun",
-    "/usr/bin/atrm",
-    "/usr/bin/chage",
-    "/usr/libexec/openssh/ssh-keysign",
-    "/usr/sbin/userhelper",
-    "/usr/sbin/usernetctl",
-    "/usr/sbin/ping6",
-    "/opt/likewise/bin/ksu",
-    "/sbin/umount.nfs",
-    "/sbin/pam_timestamp_check",
-    "/sbin/unix_chkpwd",
-    "/sbin/mount.nfs",
-    "/sbin/mount.nfs4",
-    "/sbin/umount.nfs4",
-]
+KNOWN_SUID_BINARIES = frozenset(
+    {
+        "/netscaler/ping",
+        "/netscaler/ping6",
+        "/netscaler/traceroute",
+        "/netscaler/traceroute6",
+        "/sbin/mksnap_ffs",
+        "/sbin/shutdown",
+        "/sbin/poweroff",
+        "/usr/bin/crontab",
+        "/usr/bin/lock",
+        "/usr/bin/login",
+        "/usr/bin/passwd",
+        "/usr/bin/yppasswd",
+        "/usr/bin/su",
+        "/usr/libexec/ssh-keysign",
+        "/bin/umount",
+        "/bin/ping",
+        "/bin/mount",
+        "/bin/su",
+        "/bin/ping6",
+        "/lib64/dbus-1/dbus-daemon-launch-helper",
+        "/usr/bin/atq",
+        "/usr/bin/at",
+        "/usr/bin/sudo",
+        "/usr/bin/newgrp",
+        "/usr/bin/chsh",
+        "/usr/bin/sg",
+        "/usr/bin/gpasswd",
+        "/usr/bin/chfn",
+        "/usr/bin/sudoedit",
+        "/usr/bin/staprun",
+        "/usr/bin/atrm",
+        "/usr/bin/chage",
+        "/usr/libexec/openssh/ssh-keysign",
+        "/usr/sbin/userhelper",
+        "/usr/sbin/usernetctl",
+        "/usr/sbin/ping6",
+        "/opt/likewise/bin/ksu",
+        "/sbin/umount.nfs",
+        "/sbin/pam_timestamp_check",
+        "/sbin/unix_chkpwd",
+        "/sbin/mount.nfs",
+        "/sbin/mount.nfs4",
+        "/sbin/umount.nfs4",
+    }
+)
 
 
-EVIL_CRONTAB_CONTENTS = [
-    ("ip address ", re.compile(r"([0-9]{1,3}\.){3}[0-9]{1,3}")),
-    ("/var/tmp", re.compile("/var/tmp")),
-    ("nobody user", re.compile("nobody")),
-]
+BAD_CRONTAB_USERS = frozenset({"nobody"})
+
+IPV4_OCTET = r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9])"
+
+# Tuples of (name, substring pre-filter, pattern), literal checks only need the substring
+EVIL_CRONTAB_CONTENTS = (
+    ("ip address", None, re.compile(rf"(?<![0-9]){IPV4_OCTET}(?:\.{IPV4_OCTET}){{3}}(?![0-9])")),
+    ("/var/tmp", "/var/tmp", None),
+    ("nobody user", "nobody", None),
+)
 
 FindingRecord = RecordDescriptor(
     "ioc/hit",
@@ -105,41 +137,90 @@ FindingRecord = RecordDescriptor(
 )
 
 
-def check_suspicious_php_files(target: Target, start_path) -> Iterator[FindingRecord]:
-    if not target.fs.exists(start_path):
-        return
-    for path in target.fs.path(start_path).rglob("*.php"):
-        stat = path.stat()
+@dataclass(frozen=True)
+class Finding:
+    # Lightweight finding used while scanning, only converted to a FindingRecord when it is printed
+    __slots__ = ("type", "alert", "confidence", "path")
+
+    type: str
+    alert: str
+    confidence: str
+    path: str
+
+    def to_record(self) -> FindingRecord:
+        return FindingRecord(type=self.type, alert=self.alert, confidence=self.confidence, path=self.path)
+
+
+def _walk_entries(fs, root: str) -> Iterator:
+    # Walk the directory tree using scandir, so entries can be filtered on name before they are stat'ed
+    stack = [root]
+    while stack:
+        try:
+            entries = list(fs.scandir(stack.pop()))
+        except FilesystemError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            yield entry
+
+
+def find_suspicious_php_code(data: bytes) -> list[str]:
+    if SUSPICIOUS_PHP_DB is None:
+        return [SUSPICIOUS_PHP_CONTENTS[int(match.lastgroup[1:])] for match in SUSPICIOUS_PHP_RE.finditer(data)]
+
+    matches = []
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: object) -> None:
+        matches.append(SUSPICIOUS_PHP_CONTENTS[pattern_id])
+
+    SUSPICIOUS_PHP_DB.scan(data, match_event_handler=on_match)
+    return matches
+
+
+def check_suspicious_php_files(target: Target, start_path) -> Iterator[Finding]:
+    for entry in _walk_entries(target.fs, start_path):
+        if not entry.name.endswith(".php"):
+            continue
+
+        path = entry.path
+        stat = entry.stat()
+        if not S_ISREG(stat.st_mode):
+            continue
+
         mode = stat.st_mode & 0o777
         if mode != EXPECTED_PHP_FILE_PERMISSION:
             permission_printable = oct(mode)
-            yield FindingRecord(
+            yield Finding(
                 alert=f"Suspicious php permission {permission_printable}",
                 confidence="high",
                 path=path,
                 type="php-file-permission",
             )
 
-        if stat.st_size > MAXIMUM_BYTE_SIZE_PHP_TO_CHECK_CONTENTS:
+        size = stat.st_size
+        if size == 0 or size > MAXIMUM_BYTE_SIZE_PHP_TO_CHECK_CONTENTS:
             continue
 
-        with path.open("rt") as php_file:
-            for line in php_file:
-                for evil in SUSPICIOUS_PHP_CONTENTS:
-                    if evil.lower() in line.lower():
-                        yield FindingRecord(
-                            type="php-file-contents",
-                            path=path,
-                            confidence="high",
-                            alert=f"Suspicious PHP code '{evil}'",
-                        )
+        with target.fs.open(path) as php_file:
+            data = php_file.read(size)
+
+        for evil in find_suspicious_php_code(data):
+            yield Finding(
+                type="php-file-contents",
+                path=path,
+                confidence="high",
+                alert=f"Suspicious PHP code '{evil}'",
+            )
 
 
-def check_suid_binaries(target: Target) -> Iterator[tuple[str, str]]:
+def check_suid_binaries(target: Target) -> Iterator[Finding]:
+    # target.suid_binaries() walks the whole filesystem, stream its records instead of collecting them first.
+    # This also means the returned generator can only be consumed once.
     for suid_binary_record in target.suid_binaries():
         if suid_binary_record.path in KNOWN_SUID_BINARIES:
             continue
-        yield FindingRecord(
+        yield Finding(
             type="binary/suid",
             alert="Binary with SUID bit set Observed",
             confidence="medium",
@@ -151,79 +232,103 @@ def check_crontabs(target: Target):
     for cronjob_record in target.cronjobs():
         if cronjob_record._desc.name == "linux/environmentvariable":
             continue
-        if cronjob_record.user in ["nobody"]:
-            yield FindingRecord(
+        if cronjob_record.user in BAD_CRONTAB_USERS:
+            yield Finding(
                 type="cronjob/user",
-                alert="Crontab by nobody user observed",
+                alert=f"Crontab by {cronjob_record.user} user observed",
                 confidence="high",
                 path=cronjob_record.path,
             )
-        for evil_check in EVIL_CRONTAB_CONTENTS:
-            name, pattern = evil_check
-            if match := pattern.match(cronjob_record.command):
-                yield FindingRecord(
-                    type="cronjob/command",
-                    alert=f"{name} find in crontab comand ({match.group(0)})",
-                    confidence="medium",
-                    path=cronjob_record.path,
-                )
+        command = cronjob_record.command
+        for name, prefilter, pattern in EVIL_CRONTAB_CONTENTS:
+            if prefilter and prefilter not in command:
+                continue
+            if pattern is None:
+                found = prefilter
+            elif match := pattern.search(command):
+                found = match.group(0)
+            else:
+                continue
+            yield Finding(
+                type="cronjob/command",
+                alert=f"{name} find in crontab comand ({found})",
+                confidence="medium",
+                path=cronjob_record.path,
+            )
 
 
 def check_timestomps(target: Target):
     for timestomp_dir in TIMESTOMP_DIRS:
-        for entry in target.fs.path(timestomp_dir).rglob("*"):
-            if not entry.exists():
-                continue
-            stat = entry.lstat()
-            modification_time = from_unix(stat.st_mtime)
-            changed_time = from_unix(stat.st_ctime)
-
-            difference = changed_time - modification_time
-
-            if difference.seconds > TIMESTOMP_THRESHOLD_SECONDS:
-                yield FindingRecord(
+        for entry in _walk_entries(target.fs, timestomp_dir):
+            stat = entry.stat(follow_symlinks=False)
+            difference = stat.st_ctime - stat.st_mtime
+
+            if difference > TIMESTOMP_THRESHOLD_SECONDS:
+                modification_time = from_unix(stat.st_mtime)
+                changed_time = from_unix(stat.st_ctime)
+                yield Finding(
                     type="file/timestomp",
-                    alert=f"Possibly Timestomped File Observed ({difference.seconds} seconds)",
+                    alert=(
+                        f"Possibly Timestomped File Observed ({int(difference)} seconds, "
+                        f"mtime={modification_time}, ctime={changed_time})"
+                    ),
                     confidence="medium",
                     path=entry.path,
                 )
 
 
-def ioc_check_target(target: Target) -> list[FindingRecord]:
-    findings = []
-
-    print("\n*** Checking for webshells ***\n")
+def check_webshells(target: Target) -> Iterator[Finding]:
     for path in WEBSHELL_PATHS:
-        for finding in check_suspicious_php_files(target, path):
-            print(finding)
-            findings.append(finding)
+        yield from check_suspicious_php_files(target, path)
 
-    print("\n*** Checking for timestomped files ***\n")
-    for finding in check_timestomps(target):
-        print(finding)
-        findings.append(finding)
 
-    print("\n*** Checking for suspicious cronjobs ***\n")
-    for finding in check_crontabs(target):
-        print(finding)
-        findings.append(finding)
+IOC_CHECKS = [
+    ("Checking for webshells", check_webshells),
+    ("Checking for timestomped files", check_timestomps),
+    ("Checking for suspicious cronjobs", check_crontabs),
+    ("Checking for SUID Binaries (this takes a while)", check_suid_binaries),
+]
+
+
+def _run_check_on_new_target(path: str, check) -> list[Finding]:
+    # Dissect file handles and plugin state are not thread-safe, so every worker opens its own Target
+    return list(check(Target.open(path)))
+
+
+def ioc_check_target(target: Target, workers: int = 1, path: Optional[str] = None) -> list[Finding]:
+    findings = []
 
-    print("\n*** Checking for SUID Binaries (this takes a while) ***\n")
-    for finding in check_suid_binaries(target):
-        print(finding)
-        findings.append(finding)
+    if workers == 1 or path is None:
+        for title, check in IOC_CHECKS:
+            print(f"\n*** {title} ***\n")
+            check_findings = list(check(target))
+            findings.extend(check_findings)
+            # Print all findings of a check with a single write
+            if check_findings:
+                print("\n".join(str(finding.to_record()) for finding in check_findings))
+        return findings
+
+    # Run the checks concurrently, each on its own Target opened from `path`. Results are printed in order.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [(title, executor.submit(_run_check_on_new_target, path, check)) for title, check in IOC_CHECKS]
+        for title, future in futures:
+            print(f"\n*** {title} ***\n")
+            check_findings = future.result()
+            findings.extend(check_findings)
+            if check_findings:
+                print("\n".join(str(finding.to_record()) for finding in check_findings))
 
     return findings
 
 
-def check_targets(target_paths: list[str]) -> None:
+def check_targets(target_paths: list[str], workers: int = 1) -> None:
     for path in target_paths:
         target = Target.open(path)
         if target.os != "citrix-netscaler":
             raise ValueError(f"Target not recognized as a citrix-netscaler: {target.path}: {target.os}")
         print_target_info(target)
         print("")
-        target_findings = ioc_check_target(target)
+        target_findings = ioc_check_target(target, workers, path)
         if len(target_findings) == 0:
             print("[*] No hits found for IOC checks.")
         else:
@@ -255,8 +360,18 @@ def check_targets(target_paths: list[str]) -> None:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Analyze forensic images of Citrix Netscalers for IOCs")
     parser.add_argument("targets", metavar="TARGETS", nargs="+", help="Target(s) to load")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        metavar="N",
+        type=int,
+        default=1,
+        help="number of IOC checks to run concurrently, each opens its own copy of the target (default: 1)",
+    )
     args = parser.parse_args()
-    check_targets(args.targets)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    check_targets(args.targets, args.workers)
 
 
 if __name__ == "__main__":
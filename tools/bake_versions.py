@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+#
+# file:     bake_versions.py
+# author:   Fox-IT Security Research Team <srt@fox-it.com>
+#
+# This script converts the Citrix NetScaler version CSV into the `_versions_baked.py` Python module,
+# so `scan-citrix-netscaler-version.py` does not have to parse the CSV every time it is started.
+#
+# Run it after updating `citrix-netscaler-versions.csv`:
+#
+#  $ python3 tools/bake_versions.py
+#
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEADER = """\
+# This file is generated by tools/bake_versions.py from citrix-netscaler-versions.csv, do not edit it by hand.
+#
+# Original Citrix NetScaler version CSV file:
+#  - https://gist.github.com/fox-srt/c7eb3cbc6b4bf9bb5a874fa208277e86
+"""
+
+
+def load_version_hashes(csv_path: Path) -> tuple[dict[str, str], dict[int, str]]:
+    """Return a tuple of two dictionaries: vhash_to_version, vstamp_to_version.
+
+    Returns:
+        vhash_to_version: dict[str, str] - mapping of version hash to version string
+        vstamp_to_version: dict[int, str] - mapping of rdx_en timestamp to version string
+    """
+    vhash_to_version = {}
+    vstamp_to_version = {}
+    with csv_path.open(newline="") as fh:
+        for row in csv.DictReader(fh):
+            vhash = row["vhash"]
+            version = row["version"]
+            rdx_en_date = row["rdx_en_date"]
+            rdx_en_stamp = int(row["rdx_en_stamp"])
+            dt = datetime.fromisoformat(rdx_en_date)
+            assert int(dt.timestamp()) == rdx_en_stamp, (rdx_en_date, rdx_en_stamp, version)
+            vstamp_to_version[rdx_en_stamp] = version
+            if vhash:
+                vhash_to_version[vhash] = version
+    stamps = list(vstamp_to_version.keys())
+    assert stamps == sorted(stamps), "not sorted"
+    return vhash_to_version, vstamp_to_version
+
+
+def render_module(vhash_to_version: dict[str, str], vstamp_to_version: dict[int, str]) -> str:
+    lines = [HEADER, "from types import MappingProxyType", ""]
+    lines.append("vhash_to_version = MappingProxyType(")
+    lines.append("    {")
+    lines.extend(f"        {json.dumps(vhash)}: {json.dumps(version)}," for vhash, version in vhash_to_version.items())
+    lines.append("    }")
+    lines.append(")")
+    lines.append("")
+    lines.append("vstamp_to_version = MappingProxyType(")
+    lines.append("    {")
+    lines.extend(f"        {stamp}: {json.dumps(version)}," for stamp, version in vstamp_to_version.items())
+    lines.append("    }")
+    lines.append(")")
+    lines.append("")
+    lines.append("# All rdx_en timestamps in ascending order")
+    lines.append("stamps = (")
+    lines.extend(f"    {stamp}," for stamp in sorted(vstamp_to_version))
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate the baked Citrix NetScaler version table")
+    parser.add_argument(
+        "--csv",
+        metavar="FILE",
+        type=Path,
+        default=ROOT / "citrix-netscaler-versions.csv",
+        help="input version CSV file",
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        type=Path,
+        default=ROOT / "_versions_baked.py",
+        help="output Python module",
+    )
+    args = parser.parse_args()
+
+    vhash_to_version, vstamp_to_version = load_version_hashes(args.csv)
+    args.output.write_text(render_module(vhash_to_version, vstamp_to_version))
+    print(f"Wrote {len(vstamp_to_version)} versions to {args.output}")
+
+
+if __name__ == "__main__":
+    main()